@@ -3,7 +3,7 @@ Django REST Framework API Mixins
 
 A collection of useful mixins for Django REST Framework ViewSets and APIViews.
 """
-from .filter_backends.not_in import NotInFilterBackend
+from .lookups import FieldLookup
 from .mixins import (
     APIMixin,
     ModelMixin,
@@ -12,7 +12,7 @@ from .mixins import (
     RelationshipFilterMixin,
     RoleBasedFilterMixin,
 )
-from .lookups import FieldLookup
+from .filter_backends.not_in import NotInFilterBackend
 
 __version__ = "2.0.3"
 __all__ = [
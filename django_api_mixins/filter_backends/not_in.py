@@ -47,7 +47,7 @@ class NotInFilterBackend(DjangoFilterBackend):
 
             final_key = f"{field_name}__{actual_lookup}"
 
-            if actual_lookup == FieldLookup.IN.value:
+            if actual_lookup == FieldLookup.IN:
                 value = value.split(",")
 
             if config["exclude"]:
@@ -1,7 +1,12 @@
 from enum import Enum
 
 
-class FieldLookup(Enum):
+class FieldLookup(str, Enum):
+    """
+    Django field lookup names. Members are `str` instances, so they can be
+    compared with and used in place of the plain lookup strings.
+    """
+
     EXACT = "exact"
     ICONTAINS = "icontains"
     CONTAINS = "contains"
@@ -9,4 +14,8 @@ class FieldLookup(Enum):
     GTE = "gte"
     LTE = "lte"
     IN = "in"
-    NOT_IN = "not_in"
\ No newline at end of file
+    NOT_IN = "not_in"
+
+    def __str__(self):
+        # Keep str()/format()/"%s" output equal to the lookup name on every Python version.
+        return self.value
\ No newline at end of file
@@ -1,4 +1,8 @@
-from copy import deepcopy
+import logging
+import re
+import sys
+from functools import lru_cache
+from types import SimpleNamespace
 from typing import Optional
 
 from django.db.models import (
@@ -13,17 +17,195 @@ from django.db.models import (
     BigIntegerField,
     FloatField,
     DecimalField,
-    DurationField, FileField, JSONField
+    DurationField, FileField, ImageField, JSONField
 )
-from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
-from django.db.models import Q
+from django.core.exceptions import FieldDoesNotExist, FieldError, ImproperlyConfigured
 from django.db.models.fields.related import ForeignKey
+from django.db.models.query import ModelIterable
 from django.shortcuts import get_object_or_404
 from rest_framework import status
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 
 from .lookups import FieldLookup
 
+logger = logging.getLogger(__name__)
+
+# Optional dependencies, probed once at import time instead of in every __init_subclass__.
+# Only modules that do not read Django/DRF settings are imported here, so importing this
+# package works before settings are configured; the rest are imported where they are used.
+# django-filter: pip install django-api-mixins[filters]
+try:
+    from django_filters.rest_framework import DjangoFilterBackend
+except ImportError:
+    DjangoFilterBackend = None
+
+# drf-spectacular: pip install django-api-mixins[spectacular]
+try:
+    from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
+except ImportError:
+    OpenApiParameter = extend_schema = extend_schema_view = None
+
+# Field types that get range lookups (gte/lte) in addition to the base lookups.
+_NUMERIC_OR_TEMPORAL_TYPES = (
+    IntegerField,
+    SmallIntegerField,
+    PositiveIntegerField,
+    PositiveSmallIntegerField,
+    BigIntegerField,
+    FloatField,
+    DecimalField,
+    DurationField,
+    DateField,
+    DateTimeField,
+    TimeField,
+)
+_BASE_LOOKUPS = (
+    FieldLookup.EXACT.value,
+    FieldLookup.IN.value,
+    FieldLookup.ISNULL.value,
+)
+_NUMERIC_LOOKUPS = _BASE_LOOKUPS + (
+    FieldLookup.GTE.value,
+    FieldLookup.LTE.value,
+)
+
+# Exact field class -> lookups for that field, or None for fields that are not filterable.
+# Field classes not listed here are resolved with isinstance() on first sight and memoized.
+_SKIPPED_FIELD_TYPES = (FileField, JSONField)
+_FIELD_LOOKUPS_BY_TYPE = dict.fromkeys(_NUMERIC_OR_TEMPORAL_TYPES, _NUMERIC_LOOKUPS)
+# ImageField is seeded too, being the common FileField subclass, so it never needs the fallback
+_FIELD_LOOKUPS_BY_TYPE.update(dict.fromkeys(_SKIPPED_FIELD_TYPES + (ImageField,)))
+
+
+def _get_field_lookups(field):
+    """Return the default lookups for a model field, or None if it should be skipped."""
+    field_type = type(field)
+    try:
+        return _FIELD_LOOKUPS_BY_TYPE[field_type]
+    except KeyError:
+        pass
+    if isinstance(field, _SKIPPED_FIELD_TYPES):
+        lookups = None
+    elif isinstance(field, _NUMERIC_OR_TEMPORAL_TYPES):
+        lookups = _NUMERIC_LOOKUPS
+    else:
+        lookups = _BASE_LOOKUPS
+    _FIELD_LOOKUPS_BY_TYPE[field_type] = lookups
+    return lookups
+
+
+# Common spellings of boolean query values; anything else falls back to value.lower() == "true".
+_BOOL_STRINGS = {
+    "true": True,
+    "True": True,
+    "TRUE": True,
+    "1": True,
+    "false": False,
+    "False": False,
+    "FALSE": False,
+    "0": False,
+}
+
+# Splits comma-separated query values and strips whitespace around each item in one pass.
+_LIST_SPLIT_RE = re.compile(r"\s*,\s*")
+
+# Model schemas are static at runtime, so filter fields are built once per model class.
+# Keyed by the exact class (not inherited), so subclasses get their own entry.
+_FILTER_FIELDS_CACHE = {}
+_FOREIGN_FILTER_FIELDS_CACHE = {}
+_RELATED_FILTER_FIELDS_CACHE = {}
+# serializer class -> (select_related paths, prefetch_related paths) for APIMixin.auto_optimize_queryset
+_SERIALIZER_RELATED_LOOKUPS_CACHE = {}
+# model class -> tuple of OpenApiParameter for OpenAPIFilterParametersMixin, shared by all views on that model
+_OPENAPI_FILTER_PARAMS_CACHE = {}
+
+
+@lru_cache(maxsize=1024)
+def _resolve_bool_or_fk(model, field_path):
+    """Return True if the field targeted by `field_path` on `model` is a BooleanField or ForeignKey."""
+    try:
+        parts = field_path.split("__")
+        field_name = parts[-2] if parts[-1] == "isnull" else parts[-1]
+        field_obj = model._meta.get_field(field_name)
+    except (FieldDoesNotExist, IndexError, AttributeError):
+        # Unknown field, a bare "isnull" path, or a model without _meta
+        return False
+    return isinstance(field_obj, (BooleanField, ForeignKey))
+
+
+def _get_default_filter_fields(model):
+    """Return the cached result of model._build_default_filter_fields()."""
+    filter_fields = _FILTER_FIELDS_CACHE.get(model)
+    if filter_fields is None:
+        filter_fields = _FILTER_FIELDS_CACHE[model] = model._build_default_filter_fields()
+    return filter_fields
+
+
+def _copy_filter_fields(filter_fields):
+    """Return a copy of cached filter fields with a fresh lookup list per field, safe for callers to mutate."""
+    return {key: list(lookups) for key, lookups in filter_fields.items()}
+
+
+def _get_serializer_related_lookups(serializer_class):
+    """
+    Return (select_related, prefetch_related) tuples for the model relations a serializer renders.
+    Forward FK / one-to-one fields go to select_related (unless only the pk is rendered);
+    many-to-many and reverse FK fields go to prefetch_related. Computed once per serializer class.
+    """
+    lookups = _SERIALIZER_RELATED_LOOKUPS_CACHE.get(serializer_class)
+    if lookups is not None:
+        return lookups
+
+    select_related = []
+    prefetch_related = []
+    model = getattr(getattr(serializer_class, "Meta", None), "model", None)
+    if model is not None:
+        try:
+            fields = serializer_class().fields
+        except (TypeError, KeyError, AttributeError, AssertionError, ImproperlyConfigured):
+            # Serializers that need context/arguments to build their fields are left unoptimized
+            logger.debug("Could not build fields of %s for auto_optimize_queryset", serializer_class.__name__,
+                         exc_info=True)
+            fields = {}
+        # Reverse relations are rendered under their accessor name (e.g. "item_set" without a
+        # related_name), which _meta.get_field() does not resolve
+        reverse_accessors = None
+        for name, field in fields.items():
+            source = getattr(field, "source", None) or name
+            if source == "*" or "." in source:
+                continue
+            try:
+                model_field = model._meta.get_field(source)
+            except FieldDoesNotExist:
+                if reverse_accessors is None:
+                    reverse_accessors = {rel.get_accessor_name(): rel for rel in model._meta.related_objects}
+                model_field = reverse_accessors.get(source)
+                if model_field is None:
+                    continue
+            # Skip non-relations and generic relations (no related_model to join)
+            if not model_field.is_relation or model_field.related_model is None:
+                continue
+            if model_field.auto_created and not model_field.concrete:
+                # Reverse relation: prefetch/select through its accessor, not its query name
+                relation_name = model_field.get_accessor_name()
+            else:
+                relation_name = model_field.name
+            if model_field.many_to_many or model_field.one_to_many:
+                prefetch_related.append(relation_name)
+            else:
+                if source == getattr(model_field, "attname", None):
+                    # e.g. "vendor_id": the FK column is already on the row; no join needed
+                    continue
+                use_pk_only = getattr(field, "use_pk_only_optimization", None)
+                if callable(use_pk_only) and use_pk_only():
+                    # The FK column is already on the row; no join needed
+                    continue
+                select_related.append(relation_name)
+
+    lookups = _SERIALIZER_RELATED_LOOKUPS_CACHE[serializer_class] = (tuple(select_related), tuple(prefetch_related))
+    return lookups
+
 
 class RelationshipFilterMixin:
     """
@@ -49,6 +231,45 @@ class RelationshipFilterMixin:
     reverse_relation_filters = []
     listable_filters = []
 
+    # Derived from the class-level filter lists above, rebuilt for every subclass
+    _allowed_filters = frozenset()  # all configured filter keys
+    _listable_in_keys = {}  # {listable filter key: "<key>__in"}
+    _filter_keys_source = (reverse_relation_filters, listable_filters)  # the lists the two above were built from
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._filter_keys_source = (cls.reverse_relation_filters, cls.listable_filters)
+        cls._allowed_filters, cls._listable_in_keys = cls._build_filter_keys(
+            cls.reverse_relation_filters, cls.listable_filters
+        )
+
+    @staticmethod
+    def _build_filter_keys(reverse_relation_filters, listable_filters):
+        allowed_filters = frozenset(reverse_relation_filters) | frozenset(listable_filters)
+        listable_in_keys = {key: f"{key}__in" for key in listable_filters}
+        return allowed_filters, listable_in_keys
+
+    def _get_filter_keys(self):
+        """
+        Return (allowed filter keys, {listable key: "<key>__in"}) for this view.
+        Uses the per-class precomputed values while the filter lists are the ones they were
+        built from; lists overridden on the instance (e.g. as_view(listable_filters=[...]))
+        or reassigned on the class after definition are rebuilt.
+        """
+        cls = type(self)
+        source_reverse_relation_filters, source_listable_filters = cls._filter_keys_source
+        if (
+            self.reverse_relation_filters is source_reverse_relation_filters
+            and self.listable_filters is source_listable_filters
+        ):
+            return cls._allowed_filters, cls._listable_in_keys
+        filter_keys = self.__dict__.get("_filter_keys")
+        if filter_keys is None:
+            filter_keys = self._filter_keys = self._build_filter_keys(
+                self.reverse_relation_filters, self.listable_filters
+            )
+        return filter_keys
+
     def parse_to_list(self, input_string: str):
         """
         Allow user to search data in list form.
@@ -62,58 +283,68 @@ class RelationshipFilterMixin:
 
         if isinstance(input_string, list):
             return input_string
-        # Check if the string starts and ends with square brackets
-        if input_string.startswith("[") and input_string.endswith("]"):
-            # Remove brackets and split by commas
-            return [item.strip() for item in input_string.strip("[]").split(",")]
-        else:
-            # If not in brackets, assume it's a single value and return as a list
-            return input_string.strip().split(",")
+        value = input_string.strip()
+        # Remove exactly one pair of surrounding square brackets, if present
+        if value[:1] == "[" and value[-1:] == "]":
+            value = value[1:-1].strip()
+        # Drop empty items (e.g. from "1,2," or "[]") so they never reach an __in lookup
+        return [item for item in _LIST_SPLIT_RE.split(value) if item]
 
     def convert_to_boolean_if_needed(self, model, field_path, value):
         """If the target field is BooleanField, convert string to bool."""
-        try:
-            split_field_paths = field_path.split("__")
-            if split_field_paths[-1] == "isnull":
-                field_name = field_path.split("__")[-2]
-            else:
-                field_name = field_path.split("__")[-1]
-            field_obj = model._meta.get_field(field_name)
-            if (isinstance(field_obj, BooleanField) or isinstance(field_obj, ForeignKey)) and value is not None:
-                return value.lower() == "true"
-        except Exception:
-            pass
+        if isinstance(value, str) and _resolve_bool_or_fk(model, field_path):
+            converted = _BOOL_STRINGS.get(value)
+            if converted is None:
+                converted = value.lower() == "true"
+            return converted
         return value
 
     def collect_filters(self):
-        """Return a dict of filters from query params matching allowed filter lists."""
-        params = self.request.query_params
-        if not params:
-            return {}
+        """
+        Return a dict of filters from query params matching allowed filter lists.
+        The result is cached on the view (one instance per request), so repeated
+        get_queryset() calls in the same request do not re-scan the query params.
+        """
+        filter_data = getattr(self, "_filter_data_cache", None)
+        if filter_data is not None:
+            return filter_data
 
-        allowed_filters = set(self.reverse_relation_filters) | set(self.listable_filters)
-        filter_data = {
-            field: params.get(field) for field in allowed_filters if params.get(field) is not None
-        }
-        return deepcopy(filter_data)
+        params = self.request.query_params
+        allowed_filters = self._get_filter_keys()[0]
+        if not params or allowed_filters.isdisjoint(params.keys()):
+            filter_data = {}
+        else:
+            # Query param values are immutable strings and the dict is freshly built, so no copy is needed.
+            filter_data = {
+                field: value for field, value in params.items() if field in allowed_filters and value is not None
+            }
+        self._filter_data_cache = filter_data
+        return filter_data
 
     def apply_all_filters(self, queryset):
-        """Apply both reverse and listable filters in one pass."""
+        """
+        Apply both reverse and listable filters in one pass.
+
+        All filters go into a single queryset.filter() call so lookups through the same
+        multi-valued relation (e.g. `vendor__id__in` and `vendor__name`) share one JOIN.
+        Chaining .filter() per key would add a separate JOIN for each of them.
+        """
         filter_data = self.collect_filters()
         if not filter_data:
             return queryset
 
-        final_filters = {}
         model = queryset.model
-        for filter_key, raw_value in filter_data.items():
-            value = self.convert_to_boolean_if_needed(model, filter_key, raw_value)
-
-            if filter_key in self.listable_filters:
-                final_filters[f"{filter_key}__in"] = self.parse_to_list(value)
-            else:
-                final_filters[filter_key] = value
-
-        return queryset.filter(Q(**final_filters))
+        listable_in_keys = self._get_filter_keys()[1]
+        coerce = self.convert_to_boolean_if_needed
+        parse_to_list = self.parse_to_list
+        final_filters = {
+            listable_in_keys[key] if key in listable_in_keys else key: (
+                parse_to_list(coerce(model, key, value)) if key in listable_in_keys
+                else coerce(model, key, value)
+            )
+            for key, value in filter_data.items()
+        }
+        return queryset.filter(**final_filters)
 
     def get_queryset(self):
         """
@@ -162,6 +393,39 @@ class RoleBasedFilterMixin:
     admin_roles = ['admin']  # Roles that see all data
     excluded_roles = []  # Roles that see no data
     role_mapping = {}  # Custom mapping: {role_name: field_value}
+
+    # Derived from admin_roles/excluded_roles above, rebuilt for every subclass
+    _admin_roles_set = frozenset(admin_roles)
+    _excluded_roles_set = frozenset(excluded_roles)
+    _role_sets_source = (admin_roles, excluded_roles)  # the lists the two above were built from
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not isinstance(cls.role_mapping, dict):
+            raise ImproperlyConfigured(
+                f"{cls.__name__}.role_mapping must be a dict of {{role_name: field_value}}, "
+                f"got {type(cls.role_mapping).__name__}."
+            )
+        cls._role_sets_source = (cls.admin_roles, cls.excluded_roles)
+        cls._admin_roles_set = frozenset(cls.admin_roles)
+        cls._excluded_roles_set = frozenset(cls.excluded_roles)
+
+    def _get_role_sets(self):
+        """
+        Return (admin role set, excluded role set) for membership checks.
+
+        Uses the per-class precomputed sets while the role lists are the ones they were
+        built from; lists overridden on the instance (e.g. as_view(admin_roles=[...]))
+        or reassigned on the class after definition are rebuilt.
+        """
+        cls = type(self)
+        source_admin_roles, source_excluded_roles = cls._role_sets_source
+        if self.admin_roles is source_admin_roles and self.excluded_roles is source_excluded_roles:
+            return cls._admin_roles_set, cls._excluded_roles_set
+        role_sets = self.__dict__.get("_role_sets")
+        if role_sets is None:
+            role_sets = self._role_sets = (frozenset(self.admin_roles), frozenset(self.excluded_roles))
+        return role_sets
     
     def get_role_filter_field(self):
         """Get the field name to filter on. Must be set in subclass."""
@@ -174,50 +438,71 @@ class RoleBasedFilterMixin:
     
     def get_user_role_name(self, user):
         """Extract role name from user object."""
-        if not user or not hasattr(user, 'role'):
-            return None
-        role = getattr(user, 'role', None)
-        if not role:
+        try:
+            return user.role.name
+        except AttributeError:
+            # No user, no role (including a missing reverse one-to-one), or a role without a name
             return None
-        return getattr(role, 'name', None)
     
     def get_field_value_for_role(self, role_name):
         """
         Get the field value to filter on for a given role.
         Uses role_mapping if available, otherwise uses role_name directly.
         """
-        if role_name in self.role_mapping:
-            return self.role_mapping[role_name]
-        return role_name
+        return self.role_mapping.get(role_name, role_name)
     
-    def apply_role_filter(self, queryset, user):
+    def get_role_filter_kwargs(self, user):
         """
-        Apply role-based filtering to the queryset.
+        Return the queryset filter kwargs for the user's role.
         
         Returns:
-            Filtered queryset based on user role
+            {} if the queryset should not be filtered (anonymous, no role, admin role),
+            None if the user should see no data (excluded role),
+            otherwise {role_filter_field: field value for the role}
+
+        The result is memoized on the view instance (one per request) for the given user,
+        so repeated get_queryset() calls within a request resolve the role only once.
+        It is deliberately not cached across requests: a changed role must take effect immediately.
         """
+        cached = self.__dict__.get("_role_filter_kwargs_cache")
+        if cached is not None and cached[0] is user:
+            return cached[1]
+        filter_kwargs = self._build_role_filter_kwargs(user)
+        self._role_filter_kwargs_cache = (user, filter_kwargs)
+        return filter_kwargs
+
+    def _build_role_filter_kwargs(self, user):
         if not user or not user.is_authenticated:
-            return queryset
+            return {}
         
         role_name = self.get_user_role_name(user)
         if not role_name:
-            return queryset
+            return {}
         
+        admin_roles, excluded_roles = self._get_role_sets()
+
         # Admin roles see all data
-        if role_name in self.admin_roles:
-            return queryset
+        if role_name in admin_roles:
+            return {}
         
         # Excluded roles see no data
-        if role_name in self.excluded_roles:
-            return queryset.none()
+        if role_name in excluded_roles:
+            return None
         
-        # Get field value for this role
-        field_value = self.get_field_value_for_role(role_name)
-        field_name = self.get_role_filter_field()
+        return {self.get_role_filter_field(): self.get_field_value_for_role(role_name)}
+    
+    def apply_role_filter(self, queryset, user):
+        """
+        Apply role-based filtering to the queryset.
         
-        # Apply filter
-        filter_kwargs = {field_name: field_value}
+        Returns:
+            Filtered queryset based on user role
+        """
+        filter_kwargs = self.get_role_filter_kwargs(user)
+        if filter_kwargs is None:
+            return queryset.none()
+        if not filter_kwargs:
+            return queryset
         return queryset.filter(**filter_kwargs)
     
     def get_queryset(self):
@@ -226,9 +511,11 @@ class RoleBasedFilterMixin:
         """
         queryset = super().get_queryset()
         user = getattr(self.request, 'user', None)
-        if user:
-            queryset = self.apply_role_filter(queryset, user)
-        return queryset
+        if not user:
+            return queryset
+        # Anonymous users, users without a role and admin roles get `queryset` back
+        # unchanged (no clone); excluded roles get a single .none() clone.
+        return self.apply_role_filter(queryset, user)
 
 class ModelFilterFieldsMixin:
     """
@@ -304,16 +591,12 @@ class ModelFilterFieldsMixin:
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         # Check for django-filter dependency
-        try:
-            import django_filters
-        except ImportError:
-            from django.core.exceptions import ImproperlyConfigured
+        if DjangoFilterBackend is None:
             raise ImproperlyConfigured(
                 f"{cls.__name__} uses ModelFilterFieldsMixin which requires 'django-filter' package. "
                 "Install it with: pip install django-filter\n"
                 "Or install with optional dependencies: pip install django-api-mixins[filters]"
             )
-        super().__init_subclass__(**kwargs)
         
         if "filterset_fields" not in cls.__dict__ or getattr(cls, "filterset_fields", None) is None:
             from django.core.exceptions import ImproperlyConfigured
@@ -349,17 +632,7 @@ class ModelFilterFieldsMixin:
 
     def get_filter_backends(self):
         """Return the list of filter backend classes. For APIView; GenericAPIView overrides this."""
-        # Ensure django-filter is available
-        try:
-            from django_filters.rest_framework import DjangoFilterBackend
-        except ImportError:
-            from django.core.exceptions import ImproperlyConfigured
-            raise ImproperlyConfigured(
-                f"{self.__class__.__name__} uses ModelFilterFieldsMixin which requires 'django-filter' package. "
-                "Install it with: pip install django-filter\n"
-                "Or install with optional dependencies: pip install django-api-mixins[filters]"
-            )
-        from rest_framework.settings import api_settings
+        # django-filter availability is checked once in __init_subclass__
         backends = getattr(self, "filter_backends", None) or api_settings.DEFAULT_FILTER_BACKENDS or []
         backends = list(backends)
         if self.get_search_fields():
@@ -379,8 +652,13 @@ class ModelFilterFieldsMixin:
         Return the base queryset with all filter backends applied.
         Use this in get() (or other list handlers) instead of repeating
         filter_queryset(self.get_queryset()).
+        The (lazy) queryset is cached on the view instance, so the detail and list
+        helpers share one filter-backend pass per request; don't mutate it in place.
         """
-        return self.filter_queryset(self.get_queryset())
+        queryset = self.__dict__.get("_filtered_queryset")
+        if queryset is None:
+            queryset = self.__dict__["_filtered_queryset"] = self.filter_queryset(self.get_queryset())
+        return queryset
 
     def get_object(self, pk=None):
         """
@@ -392,21 +670,38 @@ class ModelFilterFieldsMixin:
         if pk is None:
             from django.http import Http404
             raise Http404(self.detail_not_found_message)
-        queryset = self.filter_queryset(self.get_queryset())
+        queryset = self.get_filtered_queryset()
         return get_object_or_404(queryset, **{self.lookup_field: pk})
 
     def get_serializer_class(self):
-        """Resolve serializer_class for use in get_detail_response / get_list_response."""
-        serializer_class = getattr(self, "serializer_class", None)
-        if serializer_class is None and hasattr(self, "get_serializer_class"):
-            serializer_class = self.get_serializer_class()
+        """
+        Resolve serializer_class for use in get_detail_response / get_list_response.
+        The result is cached on the view instance (one per request).
+        """
+        serializer_class = self.__dict__.get("_resolved_serializer_class")
+        if serializer_class is not None:
+            return serializer_class
+        # Defer to a parent implementation (GenericAPIView, APIMixin) when there is one;
+        # plain APIView has none, so read serializer_class directly.
+        parent_get_serializer_class = getattr(super(), "get_serializer_class", None)
+        if parent_get_serializer_class is not None:
+            serializer_class = parent_get_serializer_class()
+        else:
+            serializer_class = getattr(self, "serializer_class", None)
         if serializer_class is None:
             raise ImproperlyConfigured(
                 f"{self.__class__.__name__} must set 'serializer_class' (or implement get_serializer_class) "
                 "for the default get() to work."
             )
+        self.__dict__["_resolved_serializer_class"] = serializer_class
         return serializer_class
 
+    def _serialize(self, instance, many=False):
+        """Serialize with get_serializer() when the view has one (GenericAPIView), else serializer_class."""
+        if self._has_get_serializer:
+            return self.get_serializer(instance, many=many)
+        return self.get_serializer_class()(instance, many=many)
+
     def get_detail_data(self, request, *args, **kwargs):
         """
         Return (body, status_code) for the single-object (detail) GET.
@@ -415,18 +710,15 @@ class ModelFilterFieldsMixin:
         """
         from django.http import Http404
 
-        serializer_class = self.get_serializer_class()
+        # Resolve (and validate) the serializer before hitting the database
+        self.get_serializer_class()
         try:
             obj = self.get_object(pk=kwargs.get(self.lookup_url_kwarg))
         except Http404:
             msg = self.detail_not_found_message
             body = msg if isinstance(msg, dict) else {"error": msg}
             return body, status.HTTP_404_NOT_FOUND
-        if hasattr(self, "get_serializer"):
-            serializer = self.get_serializer(obj)
-        else:
-            serializer = serializer_class(obj)
-        return serializer.data, status.HTTP_200_OK
+        return self._serialize(obj).data, status.HTTP_200_OK
 
     # def get_detail_response(self, request, *args, **kwargs):
     #     """
@@ -443,14 +735,10 @@ class ModelFilterFieldsMixin:
         If queryset is provided, use it (e.g. a paginated page); otherwise use get_filtered_queryset().
         Use get_list_response() to get a Response, or call this and build Response yourself.
         """
-        serializer_class = self.get_serializer_class()
+        self.get_serializer_class()
         if queryset is None:
             queryset = self.get_filtered_queryset()
-        if hasattr(self, "get_serializer"):
-            serializer = self.get_serializer(queryset, many=True)
-        else:
-            serializer = serializer_class(queryset, many=True)
-        return serializer.data, status.HTTP_200_OK
+        return self._serialize(queryset, many=True).data, status.HTTP_200_OK
 
     # def get_list_response(self, request, *args, queryset=None, **kwargs):
     #     """
@@ -540,51 +828,39 @@ class ModelFilterFieldsMixin:
             filterset_model = Unit  # use Unit.get_filter_fields()
     """
 
-    filterset_model = None  # optional: use this model for filter fields instead of queryset.model
+    filterset_model = None  # optional: use this model for filter fields instead of model
     lookup_url_kwarg = "pk"
     lookup_field = "pk"
     detail_not_found_message = "Not found"
+    _has_get_serializer = False  # set per subclass in __init_subclass__
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         # Check for django-filter dependency
-        try:
-            import django_filters
-        except ImportError:
-            from django.core.exceptions import ImproperlyConfigured
+        if DjangoFilterBackend is None:
             raise ImproperlyConfigured(
                 f"{cls.__name__} uses ModelFilterFieldsMixin which requires 'django-filter' package. "
                 "Install it with: pip install django-filter\n"
                 "Or install with optional dependencies: pip install django-api-mixins[filters]"
             )
-        super().__init_subclass__(**kwargs)
+        # Resolved once per view class, so get_detail_data/get_list_data skip the hasattr() per request
+        cls._has_get_serializer = callable(getattr(cls, "get_serializer", None))
         model = getattr(cls, "model", None)
         if model is None:
-            from django.core.exceptions import ImproperlyConfigured
             raise ImproperlyConfigured(
                 f"{cls.__name__} uses ModelFilterFieldsMixin but does not set "
                 "'model'. Set model = YourModel on the view so the mixin can resolve filter fields."
             )
-        get_filter_fields = getattr(model, "get_filter_fields", None)
-        if not callable(get_filter_fields):
+        # Set filterset_fields on the view *class* once, so DjangoFilterBackend and (optionally)
+        # drf-spectacular see them and requests only read the class attribute.
+        # Skip if the subclass already defines filterset_fields.
+        if "filterset_fields" in cls.__dict__:
             return
-        # Set filterset_fields on the view *class* so DjangoFilterBackend and (optionally)
-        # drf-spectacular see them. Skip if the subclass already defines filterset_fields.
-        if "filterset_fields" not in cls.__dict__:
+        filter_model = cls.filterset_model if cls.filterset_model is not None else model
+        get_filter_fields = getattr(filter_model, "get_filter_fields", None)
+        if callable(get_filter_fields):
             cls.filterset_fields = get_filter_fields()
 
-
-    def _set_filterset_fields_from_model(self, model):
-        """Set self.filterset_fields from model.get_filter_fields() if the model supports it."""
-        if model is None:
-            return
-        get_filter_fields = getattr(model, "get_filter_fields", None)
-        if not callable(get_filter_fields):
-            return
-        if "filterset_fields" in type(self).__dict__:
-            return
-        self.filterset_fields = get_filter_fields()
-
     def get_queryset(self):
         try:
             queryset = super().get_queryset()
@@ -597,24 +873,11 @@ class ModelFilterFieldsMixin:
                     "and not defining get_queryset()."
                 )
             queryset = model.objects.all()
-        model = self.filterset_model if self.filterset_model is not None else getattr(queryset, "model", None)
-        if model is not None:
-            self._set_filterset_fields_from_model(model)
         return queryset
 
     def get_filter_backends(self):
         """Return the list of filter backend classes. For APIView; GenericAPIView overrides this."""
-        # Ensure django-filter is available
-        try:
-            from django_filters.rest_framework import DjangoFilterBackend
-        except ImportError:
-            from django.core.exceptions import ImproperlyConfigured
-            raise ImproperlyConfigured(
-                f"{self.__class__.__name__} uses ModelFilterFieldsMixin which requires 'django-filter' package. "
-                "Install it with: pip install django-filter\n"
-                "Or install with optional dependencies: pip install django-api-mixins[filters]"
-            )
-        from rest_framework.settings import api_settings
+        # django-filter availability is checked once in __init_subclass__
         return getattr(self, "filter_backends", None) or api_settings.DEFAULT_FILTER_BACKENDS or []
 
     def filter_queryset(self, queryset):
@@ -659,10 +922,7 @@ class OpenAPIFilterParametersMixin:
             return
         
         # Check for django-filter dependency
-        try:
-            from django_filters.rest_framework import DjangoFilterBackend
-        except ImportError:
-            from django.core.exceptions import ImproperlyConfigured
+        if DjangoFilterBackend is None:
             raise ImproperlyConfigured(
                 f"{cls.__name__} uses OpenAPIFilterParametersMixin which requires 'django-filter' package. "
                 "Install it with: pip install django-filter\n"
@@ -670,10 +930,7 @@ class OpenAPIFilterParametersMixin:
             )
         
         # Check for drf-spectacular dependency
-        try:
-            from drf_spectacular.utils import extend_schema, extend_schema_view
-        except ImportError:
-            from django.core.exceptions import ImproperlyConfigured
+        if extend_schema_view is None:
             raise ImproperlyConfigured(
                 f"{cls.__name__} uses OpenAPIFilterParametersMixin which requires 'drf-spectacular' package. "
                 "Install it with: pip install drf-spectacular\n"
@@ -682,7 +939,6 @@ class OpenAPIFilterParametersMixin:
         
         model = getattr(cls, "model", None)
         if model is None:
-            from django.core.exceptions import ImproperlyConfigured
             raise ImproperlyConfigured(
                 f"{cls.__name__} uses OpenAPIFilterParametersMixin but does not set "
                 "'model'. Set model = YourModel on the view so the mixin can resolve filter fields for OpenAPI."
@@ -691,22 +947,42 @@ class OpenAPIFilterParametersMixin:
         if "filter_backends" not in cls.__dict__:
             cls.filter_backends = [DjangoFilterBackend]
         
+        # A subclass whose get() is the one already decorated for this model (inherited unchanged)
+        # has the parameters attached; don't wrap it a second time.
+        if (
+            getattr(cls, "_openapi_filter_params_model", None) is model
+            and getattr(cls, "get", None) is getattr(cls, "_openapi_filter_params_get", None)
+        ):
+            return
+
         params = OpenAPIFilterParametersMixin._build_openapi_filter_parameters(model)
         if params:
             # Attach to GET so Spectacular shows params on the correct operation (APIView has no "list" action)
             extend_schema_view(get=extend_schema(parameters=params))(cls)
-        params = OpenAPIFilterParametersMixin._build_openapi_filter_parameters(model)
-        if params:
-            # Attach to GET so Spectacular shows params on the correct operation (APIView has no "list" action)
-            extend_schema_view(get=extend_schema(parameters=params))(cls)
+            cls._openapi_filter_params_model = model
+            cls._openapi_filter_params_get = cls.get
     
     def get_filter_backends(self):
         """Return the list of filter backend classes. For APIView; GenericAPIView overrides this."""
-        from rest_framework.settings import api_settings
         return api_settings.DEFAULT_FILTER_BACKENDS or []
 
     @staticmethod
     def _build_openapi_filter_parameters(model):
+        """
+        Return the OpenApiParameter list for `model`, built once per model class
+        (several APIViews on the same model share the cached result).
+        A fresh list is returned because extend_schema concatenates it with a list.
+        """
+        params = _OPENAPI_FILTER_PARAMS_CACHE.get(model)
+        if params is None:
+            # Empty results are cached too, so a model that cannot be documented is only tried once
+            params = _OPENAPI_FILTER_PARAMS_CACHE[model] = tuple(
+                OpenAPIFilterParametersMixin._collect_openapi_filter_parameters(model)
+            )
+        return list(params)
+
+    @staticmethod
+    def _collect_openapi_filter_parameters(model):
         """
         Build OpenApiParameter list from model using the same path as Spectacular
         for GenericAPIView/ViewSet: call DjangoFilterExtension.get_schema_operation_parameters()
@@ -720,56 +996,49 @@ class OpenAPIFilterParametersMixin:
         if not filterset_fields:
             return []
 
-        from rest_framework.settings import api_settings
-        filter_backends = api_settings.DEFAULT_FILTER_BACKENDS or []
-
-        try:
-            from rest_framework.generics import ListAPIView
-            from django_filters.rest_framework import DjangoFilterBackend
-            from drf_spectacular.extensions import OpenApiFilterExtension
-        except ImportError as e:
-            # This should not happen if __init_subclass__ checks passed, but handle gracefully
+        if DjangoFilterBackend is None or OpenApiParameter is None:
             return []
 
         try:
-            if not hasattr(model, "objects"):
+            manager = getattr(model, "_default_manager", None)
+            if manager is None:
                 return []
-            queryset = model.objects.none()
-            temp_view = type(
-                "_TempFilterSchemaView",
-                (ListAPIView,),
-                {
-                    "queryset": queryset,
-                    "filterset_fields": filterset_fields,
-                    "filter_backends": filter_backends,
-                    "serializer_class": None,
-                },
-            )
+            queryset = manager.none()
+            # The extension only reads `queryset` (for the model) and `filterset_fields` from the view,
+            # so a plain namespace stands in for a throwaway ListAPIView subclass.
+            temp_view = SimpleNamespace(queryset=queryset, filterset_fields=filterset_fields)
+            # These read drf-spectacular settings, so they are imported on first use, not at module import.
+            # The contrib import registers the DjangoFilterBackend extension, so get_match() finds it
+            # even when views are defined before drf_spectacular.openapi has been imported.
+            from drf_spectacular.extensions import OpenApiFilterExtension
+            import drf_spectacular.contrib.django_filters  # noqa: F401
             backend = DjangoFilterBackend()
             extension = OpenApiFilterExtension.get_match(backend)
             if extension is None:
-                raise ValueError("No extension match")
+                logger.debug("No drf-spectacular filter extension matches DjangoFilterBackend; "
+                             "no OpenAPI filter parameters for %s", model.__name__)
+                return []
             # AutoSchema(view=..., path=..., method=...) fails in some versions (ViewInspector API).
             # Pass a minimal object with .view so the extension can build params from the filterset.
-            class _ViewContext:
-                view = temp_view
-            raw_params = extension.get_schema_operation_parameters(_ViewContext())
+            raw_params = extension.get_schema_operation_parameters(SimpleNamespace(view=temp_view))
             if not raw_params:
                 return []
             # Extension returns OpenAPI-style dicts; extend_schema expects OpenApiParameter.
-            from drf_spectacular.utils import OpenApiParameter
+            parameter, query = OpenApiParameter, OpenApiParameter.QUERY
             return [
-                OpenApiParameter(
+                parameter(
                     name=p["name"],
                     type=p.get("schema"),
-                    location=OpenApiParameter.QUERY,
+                    location=query,
                     description=p.get("description", ""),
                     required=p.get("required", False),
                 )
                 for p in raw_params
             ]
-        except (TypeError, ValueError, Exception):
-            pass
+        except (TypeError, ValueError, AttributeError, ImportError, FieldError, AssertionError):
+            # django-filter raises FieldError for unsupported lookups, AssertionError for
+            # unrecognized field types and TypeError for non-model field names
+            logger.debug("Could not build OpenAPI filter parameters for %s", model.__name__, exc_info=True)
         return []
 
 
@@ -781,66 +1050,82 @@ class ModelMixin:
         Dynamically build FILTER_FIELDS for all concrete model fields.
         - All fields: exact, in, isnull
         - Numeric/Date/Time-like: gte, lte additionally
+        Lookup tuples are shared between fields; get_filter_fields() returns them as fresh lists.
         """
         filter_fields = {}
-        numeric_or_temporal_types = (
-            IntegerField,
-            SmallIntegerField,
-            PositiveIntegerField,
-            PositiveSmallIntegerField,
-            BigIntegerField,
-            FloatField,
-            DecimalField,
-            DurationField,
-            DateField,
-            DateTimeField,
-            TimeField,
-        )
-        for field in cls._meta.get_fields():
-            # Only include concrete, non-M2M fields
-            if not getattr(field, "concrete", False) or getattr(field, "many_to_many", False):
-                continue
+        # concrete_fields is cached by Django and already excludes M2M, reverse and private fields
+        for field in cls._meta.concrete_fields:
+            lookups = _get_field_lookups(field)
+            if lookups is not None:
+                # Interned so the same field name across models' filter dicts is one object
+                filter_fields[sys.intern(field.name)] = lookups
+        return filter_fields
 
-            if isinstance(field, FileField):
-                continue
+    @classmethod
+    def chunked_iterator(cls, queryset=None, chunksize=1000):
+        """
+        Yield the rows of `queryset` (default: all rows of this model) in pk order,
+        fetching `chunksize` rows per query with keyset pagination (pk__gt=<last pk>).
+        Only one page is held in memory at a time, and prefetch_related lookups are
+        applied per page, so large result sets stay O(chunksize) in memory.
+        Any existing ordering on the queryset is replaced by pk ordering.
+
+        `queryset` must yield model instances and must not be sliced: .values(),
+        .values_list() and sliced querysets raise TypeError. `chunksize` must be at
+        least 1 (ValueError otherwise).
+        """
+        if queryset is None:
+            queryset = cls._default_manager.all()
+        if queryset._iterable_class is not ModelIterable:
+            raise TypeError(
+                "chunked_iterator() requires a queryset of model instances, "
+                "not a .values() or .values_list() queryset."
+            )
+        if queryset.query.is_sliced:
+            raise TypeError("chunked_iterator() cannot be used with a sliced queryset.")
+        if chunksize < 1:
+            raise ValueError("chunked_iterator() requires chunksize >= 1.")
+        return cls._iter_pk_chunks(queryset.order_by("pk"), chunksize)
 
-            field_name = field.name
-            lookups = [
-                FieldLookup.EXACT.value,
-                FieldLookup.IN.value,
-                FieldLookup.ISNULL.value,
-            ]
-            # if field.name == "result":
-            #     breakpoint()
-            if isinstance(field, JSONField):
-                # filter_fields[field_name] = ["icontains"]  # avoid exact/in/gte/lte
-                continue
-                # continue
-
-            if isinstance(field, numeric_or_temporal_types):
-                lookups.extend([
-                    FieldLookup.GTE.value,
-                    FieldLookup.LTE.value,
-                ])
-            filter_fields[field_name] = lookups
-        return filter_fields
+    @staticmethod
+    def _iter_pk_chunks(queryset, chunksize):
+        last_pk = None
+        while True:
+            page_queryset = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+            page = list(page_queryset[:chunksize])
+            if not page:
+                return
+            yield from page
+            if len(page) < chunksize:
+                return
+            last_pk = page[-1].pk
 
     @classmethod
     def get_filter_fields(cls):
-        # if  "apps.assembly" in cls.__module__:
-        #     breakpoint()
-        return cls._build_default_filter_fields()
+        """Return filter fields for this model (built once per class; each call returns fresh lists)."""
+        return _copy_filter_fields(_get_default_filter_fields(cls))
 
     @classmethod
     def get_filter_fields_for_related_model(cls, prefix):
-        filter_fields = cls.get_filter_fields()
-        new_filter_fields = dict()
-        for key, value in filter_fields.items():
-            new_filter_fields[f"{prefix}__{key}"] = value
-        return new_filter_fields
+        cache_key = (cls, prefix)
+        filter_fields = _RELATED_FILTER_FIELDS_CACHE.get(cache_key)
+        if filter_fields is None:
+            pfx = prefix + "__"
+            filter_fields = _RELATED_FILTER_FIELDS_CACHE[cache_key] = {
+                pfx + key: tuple(value) for key, value in cls.get_filter_fields().items()
+            }
+        return _copy_filter_fields(filter_fields)
 
     @classmethod
     def get_filter_fields_for_foreign_fields(cls, prefix):
+        cache_key = (cls, prefix)
+        filter_fields = _FOREIGN_FILTER_FIELDS_CACHE.get(cache_key)
+        if filter_fields is None:
+            filter_fields = _FOREIGN_FILTER_FIELDS_CACHE[cache_key] = cls._build_foreign_filter_fields(prefix)
+        return _copy_filter_fields(filter_fields)
+
+    @classmethod
+    def _build_foreign_filter_fields(cls, prefix):
         try:
             field = cls._meta.get_field(prefix)
         except FieldDoesNotExist:
@@ -848,10 +1133,11 @@ class ModelMixin:
         if not isinstance(field, ForeignKey):
             return {}
         related_model = field.related_model
-        if not (hasattr(related_model, "_build_default_filter_fields") and callable(getattr(related_model, "_build_default_filter_fields"))):
+        if not callable(getattr(related_model, "_build_default_filter_fields", None)):
             return {}
-        filter_fields = related_model._build_default_filter_fields()
-        return {f"{prefix}__{key}": value for key, value in filter_fields.items()}
+        # Reuses the related model's cached default fields, so each related model is scanned once
+        pfx = prefix + "__"
+        return {pfx + key: value for key, value in _get_default_filter_fields(related_model).items()}
 
 
 class APIMixin:
@@ -859,7 +1145,46 @@ class APIMixin:
     create_serializer_class = None
     update_serializer_class = None
     retrieve_serializer_class = None
+    # For very large list endpoints, stream rows with ModelMixin.chunked_iterator() in the renderer
+    # instead of serializing a fully materialized queryset.
     list_serializer_class = None
+    # Opt-in: apply select_related/prefetch_related for the relations the serializer renders
+    auto_optimize_queryset = False
+    # action -> name of the attribute holding the serializer class for that action
+    _ACTION_SERIALIZER_ATTRS = {
+        "create": "create_serializer_class",
+        "update": "update_serializer_class",
+        "partial_update": "update_serializer_class",
+        "list": "list_serializer_class",
+        "retrieve": "retrieve_serializer_class",
+    }
+    # HTTP method -> action for views without a router-assigned action (GET depends on the pk)
+    _METHOD_ACTIONS = {
+        "POST": "create",
+        "PUT": "update",
+        "PATCH": "partial_update",
+        "DELETE": "destroy",
+    }
+    # Methods whose request body may hold a list of objects (bulk create/update)
+    _BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.auto_optimize_queryset:
+            queryset = self._auto_optimize(queryset, self.get_serializer_class())
+        return queryset
+
+    def _auto_optimize(self, queryset, serializer_class):
+        """Apply select_related/prefetch_related derived from the serializer's relation fields."""
+        if serializer_class is None:
+            return queryset
+        select_related, prefetch_related = _get_serializer_related_lookups(serializer_class)
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        return queryset
+
     def _resolve_action(self) -> Optional[str]:
         action = getattr(self, "action", None)
         if action:
@@ -867,31 +1192,22 @@ class APIMixin:
 
         request = getattr(self, "request", None)
         method = getattr(request, "method", "").upper()
-        has_pk = bool(getattr(self, "kwargs", {}).get("pk"))
-        method_map = {
-            "POST": "create",
-            "PUT": "update",
-            "PATCH": "partial_update",
-            "DELETE": "destroy",
-        }
-
         if method == "GET":
-            return "retrieve" if has_pk else "list"
+            return "retrieve" if getattr(self, "kwargs", {}).get("pk") else "list"
 
-        return method_map.get(method)
+        return self._METHOD_ACTIONS.get(method)
 
     def get_serializer_class(self):
         self.action = self._resolve_action()
-        serializer_class = super().get_serializer_class()
-        if self.action == "create" and getattr(self, "create_serializer_class"):
-            return self.create_serializer_class
-        if self.action in ["update","partial_update"] and getattr(self, "update_serializer_class"):
-            return self.update_serializer_class
-        elif self.action == "list" and getattr(self, "list_serializer_class"):
-            return self.list_serializer_class
-        elif self.action == "retrieve" and getattr(self, "retrieve_serializer_class"):
-            return self.retrieve_serializer_class
-        return serializer_class
+        attr = self._ACTION_SERIALIZER_ATTRS.get(self.action)
+        serializer_class = getattr(self, attr, None) if attr else None
+        if serializer_class:
+            return serializer_class
+        # Plain APIView (e.g. combined with ModelFilterFieldsMixin) has no base get_serializer_class()
+        parent_get_serializer_class = getattr(super(), "get_serializer_class", None)
+        if parent_get_serializer_class is None:
+            return self.serializer_class
+        return parent_get_serializer_class()
 
 
     def get_serializer_context(self):
@@ -902,8 +1218,17 @@ class APIMixin:
         }
 
     def get_serializer(self, *args, **kwargs):
-        if isinstance(self.request.data, list):
-            kwargs["many"] = True
+        # Views are instantiated per request, so the list-body check is done once and kept on the view.
+        # Only methods that carry a body are checked, so GET/DELETE never trigger body parsing.
+        data_is_list = self.__dict__.get("_request_data_is_list")
+        if data_is_list is None:
+            request = self.request
+            data_is_list = self._request_data_is_list = (
+                request.method in self._BODY_METHODS and isinstance(request.data, list)
+            )
+        if data_is_list:
+            # An explicit many=False from the caller wins
+            kwargs.setdefault("many", True)
         try:
            return super().get_serializer(*args, **kwargs)
         except AttributeError: